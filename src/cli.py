@@ -7,13 +7,16 @@ from pathlib import Path
 
 from src.core.exceptions import ScannerError, RepositoryDiscoveryError, AnalysisError, OutputGenerationError, ValidationError
 from src.core.pipeline.analysis import execute_pipeline
-from src.core.quality.output_contract import generate_primary_report, generate_machine_output, generate_executive_verdict
+from src.core.quality.output_contract import generate_primary_report, generate_machine_output, generate_executive_verdict, serialize_machine_output
 from src.core.quality import schema_validator
 from src.services.bounty_service import BountyService
 
 
-def main():
-    """Main entry point for the CLI."""
+def main(argv=None):
+    """Main entry point for the CLI.
+
+    ``argv`` defaults to ``sys.argv[1:]``; passing a list allows in-process use.
+    """
     try:
         parser = argparse.ArgumentParser(
             description="Repository Intelligence Scanner - Decision-grade repository analysis"
@@ -96,7 +99,7 @@ def main():
             help="Directory to write validation report (default: current directory)"
         )
 
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
 
         # Handle different commands
         if args.command == 'scan' or args.command is None:
@@ -208,8 +211,7 @@ def handle_scan_command(args):
         if include_json:
             json_path = output_dir / "scan_report.json"
             json_data = generate_machine_output(analysis_result, str(repo_path))
-            with open(json_path, 'w') as f:
-                json.dump(json_data, f, indent=2, sort_keys=True)
+            json_path.write_bytes(serialize_machine_output(json_data))
             print(f"Machine-readable output written to {json_path}")
             # Validate machine output against schema; raise ValidationError on failure
             try:
@@ -5,7 +5,7 @@ import functools
 import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 from ..performance_optimizer import OptimizedThreadPool, get_performance_optimizer
 from ..monitoring import get_performance_monitor
@@ -88,8 +88,12 @@ PARALLELISM_MODEL = {
     ]
 }
 
-def execute_pipeline(repository_path: str) -> dict:
-    """Execute the full analysis pipeline with automatic optimization selection."""
+def execute_pipeline(repository_path: str, max_workers: Optional[int] = None) -> dict:
+    """Execute the full analysis pipeline with automatic optimization selection.
+
+    ``max_workers`` bounds the thread pool used for parallel stages; ``None``
+    keeps each pipeline's default (4 standard, 8 optimized).
+    """
     start_time = time.time()
     performance_optimizer = get_performance_optimizer()
     performance_monitor = get_performance_monitor()
@@ -114,7 +118,7 @@ def execute_pipeline(repository_path: str) -> dict:
             logger.info(f"Complex repository detected ({len(file_list)} files), using optimized pipeline")
             try:
                 from .optimized_analysis import execute_optimized_pipeline
-                result = execute_optimized_pipeline(repository_path)
+                result = execute_optimized_pipeline(repository_path, max_workers=max_workers)
                 # Complete performance tracking for optimized pipeline
                 execution_time = time.time() - start_time
                 performance_monitor.complete_operation("pipeline_execution", {
@@ -131,7 +135,8 @@ def execute_pipeline(repository_path: str) -> dict:
 
         # Standard pipeline for smaller repositories
         logger.info(f"Standard repository ({len(file_list)} files), using standard pipeline")
-        result = _execute_standard_pipeline(repository_path, repo_root, file_list, start_time, initial_memory)
+        result = _execute_standard_pipeline(repository_path, repo_root, file_list, start_time, initial_memory,
+                                            max_workers=max_workers)
 
         # Complete performance tracking
         execution_time = time.time() - start_time
@@ -203,7 +208,8 @@ def _estimate_repository_complexity(file_list: List[str]) -> float:
     return complexity
 
 def _execute_standard_pipeline(repository_path: str, repo_root: str, file_list: List[str],
-                             start_time: float, initial_memory: Dict[str, Any]) -> dict:
+                             start_time: float, initial_memory: Dict[str, Any],
+                             max_workers: Optional[int] = None) -> dict:
     """Execute the standard analysis pipeline for smaller repositories."""
     performance_optimizer = get_performance_optimizer()
     performance_stage_stats: Dict[str, Dict[str, float]] = {}
@@ -264,7 +270,7 @@ def _execute_standard_pipeline(repository_path: str, repo_root: str, file_list:
     test_signals = _run_stage('test_signal_analysis', analyze_test_signals, file_list, structure, semantic)
 
     # Parallel execution for independent analysis stages
-    thread_pool = OptimizedThreadPool(max_workers=4)
+    thread_pool = OptimizedThreadPool(max_workers=max_workers or 4)
     try:
         # Submit parallel tasks that depend on test_signals
         governance_future = thread_pool.submit(analyze_governance_signals, file_list, structure, semantic, test_signals)
@@ -585,10 +585,10 @@ class OptimizedAnalysisPipeline:
             decision_artifacts, authority_evaluation
         )
 
-def execute_optimized_pipeline(repository_path: str) -> Dict[str, Any]:
+def execute_optimized_pipeline(repository_path: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
     """Entry point for optimized pipeline execution."""
     optimizer = OptimizedAnalysisPipeline(
-        max_workers=8,
+        max_workers=max_workers or 8,
         enable_incremental=True
     )
     return optimizer.execute_optimized_pipeline(repository_path)
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Repository discovery stage for Repository Intelligence Scanner."""
 
 import os
+import stat
+import subprocess
 from pathlib import Path
 from typing import Optional
 
@@ -23,11 +25,20 @@ def discover_repository_root(start_path: str) -> str:
     
     path = Path(start_path)
     
+    # A single stat answers existence, directory-ness and device for the git check
+    try:
+        st = os.stat(start_path)
+    except FileNotFoundError:
+        st = None
+    except OSError as e:
+        raise RepositoryDiscoveryError(f"Filesystem error during git check: {e}", {"error": str(e)})
+    if st is not None and not stat.S_ISDIR(st.st_mode):
+        raise RepositoryDiscoveryError("Start path is not a directory", {"start_path": start_path})
+    
     # Try git root first (but only if path exists and we're in a reasonable directory depth)
-    if path.exists():
+    if st is not None:
         try:
-            if path.stat().st_dev == Path.home().stat().st_dev:  # Only try git if we're on the same filesystem as home
-                import subprocess
+            if st.st_dev == Path.home().stat().st_dev:  # Only try git if we're on the same filesystem as home
                 result = subprocess.run(
                     ["git", "rev-parse", "--show-toplevel"],
                     cwd=path,
@@ -65,7 +76,7 @@ def discover_repository_root(start_path: str) -> str:
         depth += 1
     
     # If no .git found, use the provided path (but validate it exists)
-    if not path.exists():
+    if st is None:
         raise RepositoryDiscoveryError("Start path does not exist", {"start_path": start_path})
     
     _repo_root_cache[start_path] = start_path
@@ -78,14 +89,153 @@ _repo_root_cache: dict[str, str] = {}
 _file_list_cache: dict[str, list[str]] = {}
 
 
+# Directories never descended into during file discovery ('.git' is kept;
+# any other dot-directory is skipped as well)
+_EXCLUDED_DIRS = frozenset({
+    'node_modules',
+    '__pycache__',
+    'build',
+    'dist',
+    'venv',
+    '.venv',
+    '.env',
+    '.pytest_cache',
+    'target',
+    'out',
+    '.idea',
+    '.vscode',
+    '.egg-info',
+    '.mypy_cache',
+    'site-packages',
+    'vendor',
+    'third_party',
+    'deps',
+    '.scanner_cache',
+    'analysis',
+    'tmp_scan_output',
+    'scan_output',
+    'reports',
+    'outputs',
+    '.cache',
+    '.export',
+    'dist-info',
+    '__generated__',
+})
+# Compiled, temporary and generated bundle artifacts
+_EXCLUDED_SUFFIXES = ('.pyc', '.pyo', '.class', '.so', '.min.js', '.bundle.js', '.map')
+_EXCLUDED_FILENAMES = frozenset({'.coverage', 'coverage.xml'})
+
+
 def clear_caches():
     """Clear all caches to ensure fresh analysis."""
     _repo_root_cache.clear()
     _file_list_cache.clear()
 
 
+def _git_listed_paths(repository_root: str) -> Optional[list[str]]:
+    """List tracked and untracked, non-ignored paths via ``git ls-files``.
+
+    Returns paths relative to ``repository_root``, or None if git is
+    unavailable or fails, in which case callers walk the filesystem instead.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", repository_root, "ls-files", "--cached", "--others",
+             "--exclude-standard", "-z"],
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return [os.fsdecode(p) for p in result.stdout.split(b"\0") if p]
+
+
+def _walk_files(stack: list[str], files: list[str]) -> None:
+    """Append the files below each directory on ``stack`` to ``files``."""
+    # Iterative os.scandir traversal: DirEntry type checks use the d_type
+    # returned with the directory listing, so no per-entry lstat is needed
+    # and excluded directories are pruned before they are ever opened.
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Like os.walk, never descend through directory symlinks
+                if entry.is_symlink():
+                    continue
+                # Keep '.git' only; skip any other dot-folder
+                if name != '.git' and (name.startswith('.') or name in _EXCLUDED_DIRS):
+                    continue
+                stack.append(entry.path)
+                continue
+
+            if name.endswith(_EXCLUDED_SUFFIXES) or name in _EXCLUDED_FILENAMES:
+                continue
+            # Get absolute path for consistent file access
+            try:
+                files.append(str(Path(entry.path).resolve()))
+            except (OSError, RuntimeError):
+                # Skip problematic files
+                continue
+
+
+def _collect_git_files(repository_root: str, listed: list[str], files: list[str]) -> None:
+    """Append files from a ``git ls-files`` listing, applying the walker's exclusions.
+
+    Directories git reports without recursing (nested repositories,
+    submodules) and the ``.git`` directory itself are still walked so the
+    inventory matches a filesystem walk minus git-ignored files.
+    """
+    stack = [os.path.join(repository_root, '.git')]
+    for rel_path in listed:
+        parts = rel_path.rstrip('/').split('/')
+        name = parts[-1]
+        if any(part.startswith('.') or part in _EXCLUDED_DIRS for part in parts[:-1]):
+            continue
+        full_path = os.path.join(repository_root, *parts)
+        try:
+            mode = os.lstat(full_path).st_mode
+        except OSError:
+            # Tracked but deleted from the working tree
+            continue
+
+        if stat.S_ISDIR(mode):
+            if name.startswith('.') or name in _EXCLUDED_DIRS:
+                continue
+            stack.append(full_path)
+            continue
+        if stat.S_ISLNK(mode) and os.path.isdir(full_path):
+            continue
+
+        if name.endswith(_EXCLUDED_SUFFIXES) or name in _EXCLUDED_FILENAMES:
+            continue
+        try:
+            files.append(str(Path(full_path).resolve()))
+        except (OSError, RuntimeError):
+            continue
+    _walk_files(stack, files)
+
+
 def get_canonical_file_list(repository_root: str) -> list[str]:
-    """Get a canonical, sorted list of all files in the repository with caching."""
+    """Get a canonical, sorted list of all files in the repository with caching.
+
+    Inside a git work tree the listing comes from ``git ls-files``, so
+    git-ignored files are skipped without walking their directories.
+    """
     if repository_root in _file_list_cache:
         return _file_list_cache[repository_root].copy()
     
@@ -94,75 +244,19 @@ def get_canonical_file_list(repository_root: str) -> list[str]:
     
     root_path = Path(repository_root)
     files = []
-    # Directories to always skip
-    _EXCLUDE_DIRS = {
-        'node_modules',
-        '__pycache__',
-        'build',
-        'dist',
-        'venv',
-        '.venv',
-        '.env',
-        '.pytest_cache',
-        'target',
-        'out',
-        '.idea',
-        '.vscode',
-        '.egg-info',
-        '.mypy_cache',
-        'site-packages',
-        'vendor',
-        'third_party',
-        'deps',
-        '.scanner_cache',
-        'analysis',
-        'tmp_scan_output',
-        'scan_output',
-        'reports',
-        'outputs',
-        '.cache',
-        '.export',
-        'dist-info',
-        '__generated__',
-    }
-
     try:
-        # Use os.walk for better performance than rglob
-        for dirpath, dirnames, filenames in os.walk(root_path):
-            # Filter dirnames in-place to control traversal. Keep '.git' only.
-            filtered = []
-            for d in dirnames:
-                if d == '.git':
-                    filtered.append(d)
-                    continue
-                # Skip any dot-folder except .git
-                if d.startswith('.'):
-                    continue
-                if d in _EXCLUDE_DIRS:
-                    continue
-                filtered.append(d)
-            dirnames[:] = filtered
-
-            for filename in filenames:
-                # Skip compiled and temporary files
-                if filename.endswith(('.pyc', '.pyo', '.class', '.so')):
-                    continue
-                if filename in ('.coverage', 'coverage.xml'):
-                    continue
-                # Skip typical generated bundle artifacts
-                if filename.endswith(('.min.js', '.bundle.js', '.map')):
-                    continue
-                file_path = Path(dirpath) / filename
-                # Get absolute path for consistent file access
-                try:
-                    files.append(str(file_path.resolve()))
-                except (OSError, RuntimeError):
-                    # Skip problematic files
-                    continue
+        listed = None
+        if (root_path / '.git').is_dir():
+            listed = _git_listed_paths(os.fspath(root_path))
+        if listed is not None:
+            _collect_git_files(os.fspath(root_path), listed, files)
+        else:
+            _walk_files([os.fspath(root_path)], files)
     except (OSError, ValueError):
         pass
     
-    # Sort bytewise for determinism
+    # Sort bytewise for determinism. str ordering compares code points, which
+    # matches UTF-8 byte order, so no encoded sort key is needed.
     files.sort()
     _file_list_cache[repository_root] = files.copy()
-    return files
\ No newline at end of file
+    return files
@@ -1,5 +1,14 @@
 """Output contract and quality assurance for Repository Intelligence Scanner."""
+import bisect
+import json
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 PRIMARY_REPORT = {
     "format": "markdown",
@@ -654,17 +663,15 @@ def generate_machine_output(analysis: dict, repository_path: str) -> dict:
     }
 
     # Ensure governance includes a schema_version for compatibility checks
-    gov = output.get('governance') or {}
+    gov = governance or {}
     try:
-        from pathlib import Path
         version_path = Path('docs') / 'schemas' / 'VERSION'
         if version_path.exists():
             ver = version_path.read_text(encoding='utf-8', errors='ignore').strip()
             if ver:
                 gov['schema_version'] = ver
         # fallback default
-        if 'schema_version' not in gov:
-            gov['schema_version'] = '1.0.0'
+        gov.setdefault('schema_version', '1.0.0')
     except Exception:
         gov.setdefault('schema_version', '1.0.0')
     output['governance'] = gov
@@ -731,8 +738,9 @@ def generate_machine_output(analysis: dict, repository_path: str) -> dict:
                         # Resolve relative paths against repository root if necessary
                         if not p.is_absolute():
                             p = Path(repository_path) / p
-                        if p.exists() and p.is_file():
-                            text = p.read_text(encoding='utf-8', errors='ignore')
+                        source = _load_source(p)
+                        if source is not None:
+                            text, b, newlines = source
                             # find snippet in file
                             if snippet:
                                 idx = text.find(snippet)
@@ -740,17 +748,16 @@ def generate_machine_output(analysis: dict, repository_path: str) -> dict:
                                 idx = 0
                             if idx >= 0:
                                 # compute line range (1-based inclusive)
-                                start_line = text[:idx].count('\n') + 1
+                                start_line = bisect.bisect_left(newlines, idx) + 1
                                 end_idx = idx + (len(snippet) if snippet else 0)
-                                end_line = text[:end_idx].count('\n') + 1
+                                end_line = bisect.bisect_left(newlines, end_idx) + 1
                                 ev['line_range'] = [start_line, end_line]
                                 # compute byte offsets
-                                b = text.encode('utf-8')
-                                # find byte index of snippet
                                 if snippet:
-                                    b_idx = b.find(snippet.encode('utf-8'))
+                                    snippet_bytes = snippet.encode('utf-8')
+                                    b_idx = b.find(snippet_bytes)
                                     if b_idx >= 0:
-                                        ev['byte_range'] = [b_idx, b_idx + len(snippet.encode('utf-8'))]
+                                        ev['byte_range'] = [b_idx, b_idx + len(snippet_bytes)]
                                 else:
                                     ev['byte_range'] = [0, len(b)]
                 except Exception:
@@ -764,19 +771,49 @@ def generate_machine_output(analysis: dict, repository_path: str) -> dict:
             for item in obj:
                 _normalize_evidence(item)
 
+    # Evidence often cites the same source file many times; read and index
+    # each file once (text, UTF-8 bytes, offsets of every newline)
+    _source_cache: dict[str, Optional[tuple]] = {}
+
+    def _load_source(path: Path) -> Optional[tuple]:
+        """Return (text, bytes, newline offsets) for a file, or None if unreadable."""
+        key = str(path)
+        if key not in _source_cache:
+            source = None
+            try:
+                if path.is_file():
+                    text = path.read_text(encoding='utf-8', errors='ignore')
+                    newlines = []
+                    pos = text.find('\n')
+                    while pos >= 0:
+                        newlines.append(pos)
+                        pos = text.find('\n', pos + 1)
+                    source = (text, text.encode('utf-8'), newlines)
+            except OSError:
+                source = None
+            _source_cache[key] = source
+        return _source_cache[key]
+
+    # HEAD cannot move while the output is assembled, so resolve it once per
+    # repository instead of once per evidence entry
+    _repo_commit_cache: dict[str, str] = {}
+
     def _get_repo_commit(repo_path: str) -> str:
         """Return current git HEAD sha if available, else a placeholder."""
+        if repo_path in _repo_commit_cache:
+            return _repo_commit_cache[repo_path]
+        commit = 'unknown-commit'
         try:
-            from subprocess import run, PIPE
-            import os
+            from subprocess import run
             p = Path(repo_path)
             if (p / '.git').exists():
                 r = run(['git', 'rev-parse', 'HEAD'], cwd=str(p), capture_output=True, text=True, check=False)
                 if r.returncode == 0:
-                    return r.stdout.strip()
+                    commit = r.stdout.strip()
         except Exception:
             pass
-        return 'unknown-commit'
+        _repo_commit_cache[repo_path] = commit
+        return commit
 
     def _populate_provenance_for_evidence(repo_root: str, evidence_obj: dict):
         """Populate deterministic provenance fields (line_range, byte_range) when possible."""
@@ -798,13 +835,13 @@ def generate_machine_output(analysis: dict, repository_path: str) -> dict:
                         break
             # DEBUG: trace resolution
             # print(f"PROV: repo_root={repo_root} sp={sp} p={p} exists={p.exists()}")
-            if not p.exists() or not p.is_file():
+            source = _load_source(p)
+            if source is None:
                 return
 
-            text = p.read_text(errors='ignore')
+            text, b, newlines = source
             # compute total bytes and lines
-            b = text.encode('utf-8')
-            total_lines = text.count('\n') + (0 if text.endswith('\n') else 1)
+            total_lines = len(newlines) + (0 if text.endswith('\n') else 1)
             # default byte_range covers whole file
             evidence_obj.setdefault('byte_range', [0, len(b)])
             # default line_range covers whole file
@@ -814,13 +851,15 @@ def generate_machine_output(analysis: dict, repository_path: str) -> dict:
             if snippet and isinstance(snippet, str) and snippet.strip():
                 idx = text.find(snippet)
                 if idx >= 0:
-                    before = text[:idx]
-                    start_line = before.count('\n') + 1
+                    start_line = bisect.bisect_left(newlines, idx) + 1
                     snippet_lines = snippet.count('\n') + 1
                     end_line = start_line + snippet_lines - 1
                     evidence_obj['line_range'] = [start_line, end_line]
-                    start_byte = len(before.encode('utf-8'))
-                    end_byte = start_byte + len(snippet.encode('utf-8'))
+                    # UTF-8 is self-synchronizing, so the first byte match is
+                    # the encoding of the first character match
+                    snippet_bytes = snippet.encode('utf-8')
+                    start_byte = b.find(snippet_bytes)
+                    end_byte = start_byte + len(snippet_bytes)
                     evidence_obj['byte_range'] = [start_byte, end_byte]
         except Exception:
             return
@@ -901,6 +940,23 @@ def generate_machine_output(analysis: dict, repository_path: str) -> dict:
 
 
 
+def serialize_machine_output(output: dict) -> bytes:
+    """Serialize machine output as UTF-8 JSON with sorted keys and 2-space indent.
+
+    Uses ``orjson`` when installed. The stdlib fallback emits the same layout
+    (non-ASCII characters unescaped), so strings, integers and plain decimals
+    serialize to the same bytes. Floats that need an exponent are spelled
+    differently (``1e-07``/``1e+16`` vs ``1e-7``/``1e16``), and NaN becomes
+    ``NaN`` rather than ``null``.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(
+            output,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(output, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
 def _generate_misleading_summary(misleading_signals: dict) -> str:
     """Generate summary of misleading signals for the report."""
     if not isinstance(misleading_signals, dict):
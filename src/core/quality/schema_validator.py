@@ -7,7 +7,10 @@ Behavior:
   required-key checker that reports JSON Pointer locations for missing keys.
 
 Validator loads schemas from `docs/schemas/` at the repository root.
+Parsed schemas and compiled validators are cached for the lifetime of the
+process; schema files are not expected to change while the scanner runs.
 """
+import functools
 import json
 from pathlib import Path
 from typing import Dict, Any, List
@@ -25,12 +28,19 @@ def _schema_dir() -> Path:
     return Path(__file__).resolve().parents[3] / "docs" / "schemas"
 
 
+@functools.lru_cache(maxsize=32)
 def load_schema(name: str) -> Dict[str, Any]:
+    """Load a named schema. The returned dict is shared; do not mutate it."""
     path = _schema_dir() / name
     with open(path, 'r') as f:
         return json.load(f)
 
 
+@functools.lru_cache(maxsize=32)
+def _get_validator(name: str) -> "Draft7Validator":
+    return Draft7Validator(load_schema(name))
+
+
 def _format_json_pointer(path_parts: List) -> str:
     if not path_parts:
         return '/'
@@ -64,20 +74,19 @@ def validate_against_schema(doc: Dict[str, Any], schema_name: str) -> List[str]:
 
     Returns a list of diagnostic messages. Empty list == valid.
     """
-    schema = load_schema(schema_name)
     if HAS_JSONSCHEMA:
-        validator = Draft7Validator(schema)
+        validator = _get_validator(schema_name)
         errors = []
         for err in sorted(validator.iter_errors(doc), key=lambda e: e.path):
             ptr = _format_json_pointer(list(err.path))
             errors.append(f"{ptr}: {err.message}")
         return errors
     else:
-        return _fallback_required_check(doc, schema, [])
+        return _fallback_required_check(doc, load_schema(schema_name), [])
 
 
 def _validate_file(path_to_json: str, schema_name: str) -> None:
-    doc = json.loads(Path(path_to_json).read_text())
+    doc = json.loads(Path(path_to_json).read_bytes())
     errors = validate_against_schema(doc, schema_name)
     if errors:
         msg = "Schema validation failed:\n" + "\n".join(errors)
@@ -61,7 +61,10 @@ class BuildLockIntegritySandbox:
     """Isolated sandbox for validating bounty solution integrity."""
 
     def __init__(self, docker_client=None):
-        self.docker_client = docker_client or self._get_docker_client()
+        # The Docker client is resolved on first use so constructing the
+        # sandbox never touches the Docker socket.
+        self._docker_client = docker_client
+        self._docker_client_resolved = docker_client is not None
         self.sandbox_timeout = 300  # 5 minutes
         self.supported_languages = {
             'python': {
@@ -78,6 +81,19 @@ class BuildLockIntegritySandbox:
             }
         }
 
+    @property
+    def docker_client(self):
+        """Docker client, created from the environment on first access."""
+        if not self._docker_client_resolved:
+            self._docker_client = self._get_docker_client()
+            self._docker_client_resolved = True
+        return self._docker_client
+
+    @docker_client.setter
+    def docker_client(self, client):
+        self._docker_client = client
+        self._docker_client_resolved = True
+
     def _get_docker_client(self):
         """Get Docker client with error handling."""
         if not DOCKER_AVAILABLE:
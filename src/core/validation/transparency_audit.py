@@ -13,6 +13,24 @@ import json
 
 logger = logging.getLogger(__name__)
 
+_PR_DISCLOSURE_RE = re.compile(
+    r'(?i)(generated|created|developed)\s+(by|using|with)\s+(ai|artificial intelligence|machine learning|automated)',
+    re.MULTILINE
+)
+_COMMIT_DISCLOSURE_RE = re.compile(
+    r'(?i)(ai|artificial intelligence|automated|generated)',
+    re.MULTILINE
+)
+_CODE_DISCLOSURE_RE = re.compile(
+    r'(?i)(generated|auto.*generated|ai.*generated)',
+    re.MULTILINE
+)
+_CONFIDENCE_RE = re.compile(r'\d+(?:\.\d+)?%\s*confidence', re.IGNORECASE)
+# Persona mentions (e.g., "Senior Architect", "Ziverge-style")
+_PERSONA_RE = re.compile(
+    r'(?i)senior architect|experienced developer|industry expert|professional implementation'
+)
+
 @dataclass
 class DisclosureViolation:
     """Represents a missing or incorrect disclosure."""
@@ -38,26 +56,17 @@ class EthicalTransparencyAudit:
     def __init__(self):
         self.required_disclosures = {
             'pr_description': {
-                'pattern': re.compile(
-                    r'(?i)(generated|created|developed)\s+(by|using|with)\s+(ai|artificial intelligence|machine learning|automated)',
-                    re.MULTILINE
-                ),
+                'pattern': _PR_DISCLOSURE_RE,
                 'required_text': 'Generated by AI with human oversight and validation.',
                 'platforms': ['github', 'gitlab', 'bitbucket']
             },
             'commit_message': {
-                'pattern': re.compile(
-                    r'(?i)(ai|artificial intelligence|automated|generated)',
-                    re.MULTILINE
-                ),
+                'pattern': _COMMIT_DISCLOSURE_RE,
                 'required_text': 'AI-assisted development',
                 'platforms': ['github', 'gitlab']
             },
             'code_comments': {
-                'pattern': re.compile(
-                    r'(?i)(generated|auto.*generated|ai.*generated)',
-                    re.MULTILINE
-                ),
+                'pattern': _CODE_DISCLOSURE_RE,
                 'required_text': 'Code generated with AI assistance',
                 'platforms': ['all']
             }
@@ -150,7 +159,7 @@ class EthicalTransparencyAudit:
 
         # Check for confidence display if required
         if platform_config.get('max_confidence_display', False):
-            if not re.search(r'\d+(?:\.\d+)?%\s*confidence', description, re.IGNORECASE):
+            if not _CONFIDENCE_RE.search(description):
                 violations.append(DisclosureViolation(
                     file_path='PR_DESCRIPTION',
                     violation_type='missing_confidence_display',
@@ -211,15 +220,7 @@ class EthicalTransparencyAudit:
 
         description = pr_content.get('description', '')
 
-        # Check for persona mention (e.g., "Senior Architect", "Ziverge-style")
-        persona_indicators = [
-            r'(?i)senior architect',
-            r'(?i)experienced developer',
-            r'(?i)industry expert',
-            r'(?i)professional implementation'
-        ]
-
-        has_persona = any(re.search(pattern, description) for pattern in persona_indicators)
+        has_persona = _PERSONA_RE.search(description) is not None
 
         if not has_persona:
             violations.append(DisclosureViolation(
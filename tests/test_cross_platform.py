@@ -15,6 +15,15 @@ import pytest
 from src.core.pipeline.analysis import execute_pipeline
 from src.core.exceptions import AnalysisError
 
+# Commit identity via environment instead of per-repo `git config` calls
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
 
 class TestCrossPlatform:
     """Cross-platform compatibility tests."""
@@ -177,13 +186,12 @@ class TestCrossPlatform:
 
     def _init_git_repo(self, path: Path):
         """Initialize a git repository."""
-        import subprocess
-        subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=path, check=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=path, check=True)
+        subprocess.run(["git", "init", "-q"], cwd=path, check=True,
+                       stdin=subprocess.DEVNULL, capture_output=True)
 
     def _git_add_commit(self, path: Path, message: str):
         """Add all files and commit."""
-        import subprocess
-        subprocess.run(["git", "add", "."], cwd=path, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", message], cwd=path, check=True, capture_output=True)
\ No newline at end of file
+        subprocess.run(["git", "add", "."], cwd=path, check=True,
+                       stdin=subprocess.DEVNULL, capture_output=True)
+        subprocess.run(["git", "commit", "-q", "-m", message], cwd=path, check=True,
+                       env=_GIT_ENV, stdin=subprocess.DEVNULL, capture_output=True)
\ No newline at end of file
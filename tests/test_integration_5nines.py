@@ -14,12 +14,6 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
-from src.core.validation.backtesting import DifferentialLogicOracle, BacktestResult, HistoricalPR
-from src.core.validation.style_audit import ContextualGraftingAudit, StyleProfile
-from src.core.validation.build_sandbox import BuildLockIntegritySandbox
-from src.core.validation.transparency_audit import EthicalTransparencyAudit
-from src.core.bounty.reputation_monitor import ReputationMonitor
-
 
 class TestFiveNinesValidation:
     """Integration tests for 99.999% accuracy validation."""
@@ -50,8 +44,17 @@ def test_main():
 
         return repo_path
 
+    @pytest.fixture
+    def monitor(self):
+        """Fresh reputation monitor; tests record submissions and feedback into it."""
+        from src.core.bounty.reputation_monitor import ReputationMonitor
+
+        return ReputationMonitor()
+
     def test_differential_logic_oracle_backtesting(self, temp_repo):
         """Test backtesting engine with synthetic historical data."""
+        from src.core.validation.backtesting import DifferentialLogicOracle, HistoricalPR
+
         oracle = DifferentialLogicOracle()
 
         # Generate synthetic PRs
@@ -69,6 +72,8 @@ def test_main():
 
     def test_contextual_grafting_audit(self, temp_repo):
         """Test style consistency auditing."""
+        from src.core.validation.style_audit import ContextualGraftingAudit
+
         auditor = ContextualGraftingAudit()
 
         # Create test code with some style issues
@@ -95,11 +100,11 @@ def test_new_feature():
 
     def test_build_lock_integrity_sandbox(self, temp_repo):
         """Test build and test validation in sandbox."""
-        sandbox = BuildLockIntegritySandbox()
+        from src.core.validation.build_sandbox import BuildLockIntegritySandbox
 
         # Mock Docker client since Docker might not be available in CI
         mock_docker = Mock()
-        sandbox.docker_client = mock_docker
+        sandbox = BuildLockIntegritySandbox(docker_client=mock_docker)
 
         # Mock container execution
         mock_container = Mock()
@@ -120,32 +125,48 @@ def solve_problem():
         assert mock_docker.containers.run.called
         assert result.overall_success is not None
 
-    def test_reputation_roi_monitor_validation(self):
-        """Test reputation monitoring with simulated feedback."""
-        monitor = ReputationMonitor()
+    def test_build_sandbox_defers_docker_client(self):
+        """Constructing the sandbox must not connect to Docker."""
+        from src.core.validation.build_sandbox import BuildLockIntegritySandbox
+
+        with patch.object(BuildLockIntegritySandbox, "_get_docker_client", return_value=None) as get_client:
+            sandbox = BuildLockIntegritySandbox()
+            assert not get_client.called
+
+            assert sandbox.docker_client is None
+            assert sandbox.docker_client is None
+            assert get_client.call_count == 1
 
+    @pytest.mark.parametrize("scenario", ['fast_merge', 'slow_merge', 'rejected', 'high_friction'])
+    def test_reputation_roi_monitor_validation(self, monitor, scenario):
+        """Test reputation monitoring with simulated feedback."""
         # Record test submission
         bounty_id = "test_bounty_001"
         submission_time = datetime.now()
         monitor.record_bounty_submission(bounty_id, "algora", submission_time)
 
-        # Simulate different feedback scenarios
-        scenarios = ['fast_merge', 'slow_merge', 'rejected', 'high_friction']
+        # Simulate the feedback scenario
+        result = monitor.simulate_maintainer_feedback(bounty_id, scenario)
+        assert result['scenario'] == scenario
+        assert 'outcome' in result
+
+    def test_reputation_roi_metrics_across_scenarios(self, monitor):
+        """Test combined ROI after the full sequence of feedback scenarios."""
+        bounty_id = "test_bounty_001"
+        monitor.record_bounty_submission(bounty_id, "algora", datetime.now())
 
-        for scenario in scenarios:
-            result = monitor.simulate_maintainer_feedback(bounty_id, scenario)
-            assert result['scenario'] == scenario
-            assert 'outcome' in result
+        # Rejected/high-friction feedback alone yields no merge ROI, so the
+        # combined score is checked over the whole sequence
+        for scenario in ['fast_merge', 'slow_merge', 'rejected', 'high_friction']:
+            monitor.simulate_maintainer_feedback(bounty_id, scenario)
 
         # Check ROI metrics
         roi_metrics = monitor.get_roi_metrics()
         assert 'combined_roi_score' in roi_metrics
         assert 0.0 <= roi_metrics['combined_roi_score'] <= 1.0
 
-    def test_star_loss_trigger_simulation(self):
+    def test_star_loss_trigger_simulation(self, monitor):
         """Test star loss circuit breaker simulation."""
-        monitor = ReputationMonitor()
-
         # Test 2% star loss trigger
         result = monitor.simulate_star_loss_trigger(0.02)
 
@@ -155,10 +176,8 @@ def solve_problem():
         assert result['threshold_triggered'] is True
         assert len(result['trigger_actions']) > 0
 
-    def test_latency_accuracy_validation(self):
+    def test_latency_accuracy_validation(self, monitor):
         """Test notification ping latency validation."""
-        monitor = ReputationMonitor()
-
         result = monitor.validate_latency_accuracy(5)
 
         assert len(result['test_results']) == 5
@@ -168,6 +187,8 @@ def solve_problem():
 
     def test_ethical_transparency_audit(self):
         """Test transparency compliance auditing."""
+        from src.core.validation.transparency_audit import EthicalTransparencyAudit
+
         auditor = EthicalTransparencyAudit()
 
         # Test PR content with missing disclosure
@@ -194,6 +215,8 @@ def solve_problem():
 
     def test_integrity_footer_generation(self):
         """Test standardized integrity footer generation."""
+        from src.core.validation.transparency_audit import EthicalTransparencyAudit
+
         auditor = EthicalTransparencyAudit()
 
         footer = auditor.generate_integrity_footer(99.999, 'Senior Architect')
@@ -205,6 +228,8 @@ def solve_problem():
 
     def test_platform_compliance_validation(self):
         """Test platform-specific compliance validation."""
+        from src.core.validation.transparency_audit import EthicalTransparencyAudit
+
         auditor = EthicalTransparencyAudit()
 
         pr_content = {
@@ -220,8 +245,14 @@ def solve_problem():
         assert 'passed' in algora_result
 
     @pytest.mark.integration
-    def test_end_to_end_5nines_validation(self, temp_repo):
+    @pytest.mark.slow
+    def test_end_to_end_5nines_validation(self, temp_repo, monitor):
         """End-to-end test of all 5 validation phases."""
+        from src.core.validation.backtesting import DifferentialLogicOracle
+        from src.core.validation.style_audit import ContextualGraftingAudit
+        from src.core.validation.build_sandbox import BuildLockIntegritySandbox
+        from src.core.validation.transparency_audit import EthicalTransparencyAudit
+
         # Phase 1: Backtesting
         oracle = DifferentialLogicOracle()
         prs = oracle._generate_synthetic_prs(str(temp_repo), 6)
@@ -237,7 +268,6 @@ def solve_problem():
         sandbox.docker_client = None  # Skip Docker test
 
         # Phase 4: Reputation Monitor
-        monitor = ReputationMonitor()
         monitor.simulate_maintainer_feedback("test_bounty", "fast_merge")
         roi_metrics = monitor.get_roi_metrics()
 
@@ -2,7 +2,10 @@
 
 import json
 
-from src.core.quality.output_contract import generate_primary_report, generate_machine_output, generate_executive_verdict
+import pytest
+
+from src.core.quality import output_contract
+from src.core.quality.output_contract import generate_primary_report, generate_machine_output, generate_executive_verdict, serialize_machine_output
 
 
 def test_generate_primary_report_basic():
@@ -101,14 +104,40 @@ def test_machine_output_json_serializable():
     output = generate_machine_output(analysis, repository_path)
     
     # Should not raise exception
-    json_str = json.dumps(output, sort_keys=True)
-    assert json_str
+    json_bytes = serialize_machine_output(output)
+    assert json_bytes
     
     # Should be able to parse back
-    parsed = json.loads(json_str)
+    parsed = json.loads(json_bytes)
     assert parsed == output
 
 
+def test_machine_output_serialization_layout_is_backend_independent(monkeypatch):
+    """orjson and the stdlib fallback write identical bytes for string/integer payloads."""
+    output = generate_machine_output({"files": ["test.txt", "caf\u00e9.py"]}, "/test")
+
+    fast = serialize_machine_output(output)
+    monkeypatch.setattr(output_contract, "HAS_ORJSON", False)
+    fallback = serialize_machine_output(output)
+
+    assert fast == fallback
+
+
+def test_machine_output_serialization_exponent_floats_differ_by_backend(monkeypatch):
+    """Exponent-form floats parse back equal but are spelled differently per backend."""
+    pytest.importorskip("orjson")
+    payload = {"ratio": 1e-07, "total": 1e16, "share": 0.5}
+
+    fast = serialize_machine_output(payload)
+    monkeypatch.setattr(output_contract, "HAS_ORJSON", False)
+    fallback = serialize_machine_output(payload)
+
+    assert json.loads(fast) == json.loads(fallback)
+    assert b'"ratio": 1e-7,' in fast and b'"total": 1e16' in fast
+    assert b'"ratio": 1e-07,' in fallback and b'"total": 1e+16' in fallback
+    assert b'"share": 0.5,' in fast and b'"share": 0.5,' in fallback
+
+
 def test_machine_output_schema_compliance():
     """Test that machine output complies with expected schema structure."""
     analysis = {"files": ["a.txt", "b.txt"]}
@@ -16,3 +16,8 @@ def test_bounty_assessment_schema_noop():
     # Smoke test placeholder: ensure validator loads schema
     s = schema_validator.load_schema('bounty_assessment.schema.json')
     assert 'required' in s
+
+
+def test_load_schema_is_cached():
+    first = schema_validator.load_schema('bounty_assessment.schema.json')
+    assert schema_validator.load_schema('bounty_assessment.schema.json') is first
@@ -5,47 +5,144 @@ Tests system performance under load, with large repositories,
 and multiple concurrent analyses.
 """
 
+import multiprocessing
+import re
 import time
 import tempfile
 import shutil
+import tarfile
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import pytest
 
-from src.core.pipeline.analysis import execute_pipeline
 from src.core.exceptions import AnalysisError
 
+LARGE_REPO_NUM_FILES = 1000
+LARGE_REPO_AVG_FILE_SIZE = 1024
+
+_FILE_INDEX_RE = re.compile(r"file_(\d+)\.py$")
+
+
+def _create_large_repo_structure(repo_path: Path, num_files: int, avg_file_size: int):
+    """Create a simulated large repository structure."""
+    # Create git repo
+    _init_git_repo(repo_path)
+
+    # Create the nested directory chain once (dir_0/dir_1/.../dir_4)
+    dirs = []
+    current = repo_path
+    for d in range(5):
+        current = current / f"dir_{d}"
+        current.mkdir(exist_ok=True)
+        dirs.append(current)
+
+    header = b'"""Test file %d"""\n'
+    line = b"x = 42\n"
+    for i in range(num_files):
+        # Files are spread over depths 1-5
+        file_path = dirs[i % 5] / f"file_{i}.py"
+        content_size = avg_file_size + (i % 1000)  # Vary size slightly
+        file_path.write_bytes(header % i + line * (content_size // 10))
+
+
+def _create_test_repo(repo_path: Path, name: str):
+    """Create a simple test repository."""
+    _init_git_repo(repo_path)
+
+    # Create basic files
+    (repo_path / "README.md").write_text(f"# {name}\n\nTest repository.")
+    (repo_path / "main.py").write_text("print('Hello, World!')")
+    (repo_path / "requirements.txt").write_text("pytest>=7.0.0")
+
+
+def _init_git_repo(path: Path):
+    """Initialize a git repository.
+
+    The pipeline only resolves the work-tree root (``git rev-parse
+    --show-toplevel``), which does not need a HEAD commit, so a bare
+    ``git init`` is all the setup these tests require.
+    """
+    import subprocess
+    subprocess.run(
+        ["git", "-c", "init.defaultBranch=main", "init", "-q"],
+        cwd=path, check=True, stdin=subprocess.DEVNULL, capture_output=True
+    )
+
+
+@pytest.fixture(scope="session")
+def large_repo_template(tmp_path_factory):
+    """Build the synthetic large repository once per session, archived as a tar."""
+    base = tmp_path_factory.mktemp("large_repo_template")
+    template = base / "repo"
+    template.mkdir()
+    _create_large_repo_structure(
+        template, num_files=LARGE_REPO_NUM_FILES, avg_file_size=LARGE_REPO_AVG_FILE_SIZE
+    )
+    template_tar = base / "repo.tar"
+    with tarfile.open(template_tar, "w") as tar:
+        tar.add(template, arcname=".")
+    shutil.rmtree(template)
+    return template_tar
+
+
+def _copy_large_repo(template_tar: Path, dest: Path, num_files: int = LARGE_REPO_NUM_FILES) -> Path:
+    """Extract the first ``num_files`` generated files of the template into ``dest``."""
+    def _members(tar):
+        for member in tar:
+            match = _FILE_INDEX_RE.search(member.name)
+            if match and int(match.group(1)) >= num_files:
+                continue
+            yield member
+
+    dest.mkdir()
+    with tarfile.open(template_tar, "r") as tar:
+        extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+        tar.extractall(dest, members=_members(tar), **extract_kwargs)
+    return dest
+
 
 class TestPerformance:
     """Performance validation tests."""
 
-    def test_large_repository_analysis(self):
+    @pytest.mark.slow
+    def test_large_repository_analysis(self, benchmark, large_repo_template, tmp_path):
         """Test analysis of a large repository (simulated)."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir) / "large_repo"
-            repo_path.mkdir()
+        from src.core.pipeline.analysis import execute_pipeline
 
-            # Create simulated large repo structure
-            self._create_large_repo_structure(repo_path, num_files=1000, avg_file_size=1024)
+        repo_path = _copy_large_repo(large_repo_template, tmp_path / "large_repo")
 
-            start_time = time.time()
-            try:
-                results = execute_pipeline(str(repo_path))
-                analysis_time = time.time() - start_time
+        # Time the pipeline call itself, not pytest-benchmark's bookkeeping
+        timings = []
 
-                # Assert reasonable performance (under 45 seconds for 1000 files)
-                assert analysis_time < 45.0, f"Analysis took {analysis_time:.2f}s, expected < 45s"
+        def _timed_run():
+            start_time = time.perf_counter()
+            result = execute_pipeline(str(repo_path))
+            timings.append(time.perf_counter() - start_time)
+            return result
 
-                # Assert results are valid
-                assert isinstance(results, dict) and len(results) > 0
-                assert "advanced_code" in str(results)  # Check for expected analysis components
+        try:
+            # A single round: later rounds would be served by the scanner's
+            # on-disk analysis cache. pytest-benchmark records the timing so
+            # runs can be compared with --benchmark-compare; one sample is
+            # too noisy to gate on, so only the hard ceiling below fails.
+            results = benchmark.pedantic(_timed_run, rounds=1, iterations=1)
+            analysis_time = timings[0]
 
-            except AnalysisError as e:
-                pytest.fail(f"Analysis failed on large repository: {e}")
+            # Hard ceiling (under 45 seconds for 1000 files)
+            assert analysis_time < 45.0, f"Analysis took {analysis_time:.2f}s, expected < 45s"
+
+            # Assert results are valid
+            assert isinstance(results, dict) and len(results) > 0
+            assert "advanced_code" in str(results)  # Check for expected analysis components
+
+        except AnalysisError as e:
+            pytest.fail(f"Analysis failed on large repository: {e}")
 
     def test_concurrent_analyses(self):
         """Test multiple concurrent repository analyses."""
+        from src.core.pipeline.analysis import execute_pipeline
+
         num_concurrent = 5
 
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -53,12 +150,16 @@ class TestPerformance:
             for i in range(num_concurrent):
                 repo_path = Path(temp_dir) / f"repo_{i}"
                 repo_path.mkdir()
-                self._create_test_repo(repo_path, f"Test Repo {i}")
+                _create_test_repo(repo_path, f"Test Repo {i}")
                 repo_paths.append(str(repo_path))
 
-            start_time = time.time()
+            start_time = time.perf_counter()
 
-            with ThreadPoolExecutor(max_workers=num_concurrent) as executor:
+            # Separate processes so CPU-bound analyses are not serialized on the GIL.
+            # Spawn rather than fork: earlier pipeline runs leave thread pools
+            # behind, and forking while they hold locks deadlocks the workers.
+            with ProcessPoolExecutor(max_workers=num_concurrent,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
                 futures = [executor.submit(execute_pipeline, path) for path in repo_paths]
                 results = []
 
@@ -69,7 +170,7 @@ class TestPerformance:
                     except Exception as e:
                         pytest.fail(f"Concurrent analysis failed: {e}")
 
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             avg_time = total_time / num_concurrent
 
             # Assert all analyses completed
@@ -78,104 +179,76 @@ class TestPerformance:
             # Assert reasonable average time (under 5 seconds each)
             assert avg_time < 5.0, f"Average analysis time {avg_time:.2f}s, expected < 5s"
 
-    def test_memory_usage_bounds(self):
+    @pytest.mark.slow
+    def test_memory_usage_bounds(self, large_repo_template, tmp_path):
         """Test that memory usage stays within reasonable bounds."""
+        from src.core.pipeline.analysis import execute_pipeline
         import psutil
         import os
+        import threading
 
         process = psutil.Process(os.getpid())
+
+        # The full template carries the same ~1MB of source as the former
+        # 500 x 2KB layout, spread over more files.
+        repo_path = _copy_large_repo(large_repo_template, tmp_path / "memory_test_repo")
+
         initial_memory = process.memory_info().rss / 1024 / 1024  # MB
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir) / "memory_test_repo"
-            repo_path.mkdir()
-            self._create_large_repo_structure(repo_path, num_files=500, avg_file_size=2048)
+        # Sample RSS in the background so transient peaks during the run count
+        samples = [initial_memory]
+        stop = threading.Event()
+
+        def _sample_rss():
+            while not stop.wait(0.05):
+                samples.append(process.memory_info().rss / 1024 / 1024)
 
+        sampler = threading.Thread(target=_sample_rss, daemon=True)
+        sampler.start()
+
+        try:
             try:
                 results = execute_pipeline(str(repo_path))
+            finally:
+                stop.set()
+                sampler.join()
+                samples.append(process.memory_info().rss / 1024 / 1024)
 
-                peak_memory = process.memory_info().rss / 1024 / 1024  # MB
-                memory_increase = peak_memory - initial_memory
+            peak_memory = max(samples)
+            memory_increase = peak_memory - initial_memory
 
-                # Assert memory increase is reasonable (under 500MB)
-                assert memory_increase < 500, f"Memory increase {memory_increase:.1f}MB, expected < 500MB"
+            # Assert memory increase is reasonable (under 500MB)
+            assert memory_increase < 500, f"Memory increase {memory_increase:.1f}MB, expected < 500MB"
 
-            except AnalysisError as e:
-                pytest.fail(f"Analysis failed in memory test: {e}")
+        except AnalysisError as e:
+            pytest.fail(f"Analysis failed in memory test: {e}")
 
-    def test_scalability_with_workers(self):
+    @pytest.mark.slow
+    def test_scalability_with_workers(self, large_repo_template, tmp_path):
         """Test performance scaling with different worker counts."""
+        from src.core.pipeline.analysis import execute_pipeline
+
         worker_counts = [1, 2, 4]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir) / "scale_test_repo"
-            repo_path.mkdir()
-            self._create_large_repo_structure(repo_path, num_files=200, avg_file_size=1024)
-
-            times = {}
-
-            for workers in worker_counts:
-                start_time = time.time()
-                try:
-                    results = execute_pipeline(str(repo_path))
-                    elapsed = time.time() - start_time
-                    times[workers] = elapsed
-
-                    # Assert analysis completes
-                    assert isinstance(results, dict) and len(results) > 0
-
-                except AnalysisError as e:
-                    pytest.fail(f"Analysis failed with {workers} workers: {e}")
-
-            # Assert some scaling benefit (2 workers should be faster than 1, but not strictly)
-            if 2 in times and 1 in times:
-                # Allow some overhead, but expect some improvement
-                scaling_ratio = times[1] / times[2]
-                assert scaling_ratio > 0.8, f"Poor scaling: {scaling_ratio:.2f}x speedup with 2 workers"
-
-    def _create_large_repo_structure(self, repo_path: Path, num_files: int, avg_file_size: int):
-        """Create a simulated large repository structure."""
-        # Create git repo
-        self._init_git_repo(repo_path)
-
-        # Create directory structure
-        for i in range(num_files):
-            # Create nested directories
-            depth = i % 5 + 1
-            file_path = repo_path
-            for d in range(depth):
-                file_path = file_path / f"dir_{d}"
-                file_path.mkdir(exist_ok=True)
-
-            # Create file with content
-            file_path = file_path / f"file_{i}.py"
-            content_size = avg_file_size + (i % 1000)  # Vary size slightly
-            content = f'"""Test file {i}"""\n' + "x = 42\n" * (content_size // 10)
-            file_path.write_text(content)
-
-        # Add and commit
-        self._git_add_commit(repo_path, "Add large repo structure")
-
-    def _create_test_repo(self, repo_path: Path, name: str):
-        """Create a simple test repository."""
-        self._init_git_repo(repo_path)
-
-        # Create basic files
-        (repo_path / "README.md").write_text(f"# {name}\n\nTest repository.")
-        (repo_path / "main.py").write_text("print('Hello, World!')")
-        (repo_path / "requirements.txt").write_text("pytest>=7.0.0")
-
-        self._git_add_commit(repo_path, "Initial commit")
-
-    def _init_git_repo(self, path: Path):
-        """Initialize a git repository."""
-        import subprocess
-        subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=path, check=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=path, check=True)
-
-    def _git_add_commit(self, path: Path, message: str):
-        """Add all files and commit."""
-        import subprocess
-        subprocess.run(["git", "add", "."], cwd=path, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", message], cwd=path, check=True, capture_output=True)
\ No newline at end of file
+        repo_path = _copy_large_repo(large_repo_template, tmp_path / "scale_test_repo", num_files=200)
+
+        times = {}
+
+        for workers in worker_counts:
+            start_time = time.perf_counter()
+            try:
+                results = execute_pipeline(str(repo_path), max_workers=workers)
+                elapsed = time.perf_counter() - start_time
+                times[workers] = elapsed
+
+                # Assert analysis completes
+                assert isinstance(results, dict) and len(results) > 0
+
+            except AnalysisError as e:
+                pytest.fail(f"Analysis failed with {workers} workers: {e}")
+
+        # Assert some scaling benefit (2 workers should be faster than 1, but not strictly)
+        if 2 in times and 1 in times:
+            # Allow some overhead, but expect some improvement
+            scaling_ratio = times[1] / times[2]
+            assert scaling_ratio > 0.8, f"Poor scaling: {scaling_ratio:.2f}x speedup with 2 workers"
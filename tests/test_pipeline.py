@@ -1,6 +1,6 @@
 """Tests for analysis pipeline."""
 
-import tempfile
+import subprocess
 from pathlib import Path
 
 from src.core.pipeline.analysis import execute_pipeline
@@ -29,15 +29,11 @@ def test_execute_pipeline_basic(tmp_path):
 
 def test_execute_pipeline_git_repo(tmp_path):
     """Test pipeline execution on git repository."""
-    import subprocess
-    
     # Create and initialize git repo
     repo_dir = tmp_path / "git_repo"
     repo_dir.mkdir()
     
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True, capture_output=True)
     
     # Create files
     (repo_dir / "README.md").write_text("# Test")
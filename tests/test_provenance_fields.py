@@ -40,3 +40,39 @@ def test_provenance_population(tmp_path):
     assert ev['line_range'][0] == 2
     assert 'byte_range' in ev and isinstance(ev['byte_range'], list)
     assert ev['repo_commit']  # exists (may be 'unknown-commit')
+
+
+def test_provenance_offsets_for_repeated_source(tmp_path):
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    src = repo / 'file.py'
+    content = 'héllo\nfirst match\nsecond\nmatch\n'
+    src.write_text(content, encoding='utf-8')
+    raw = content.encode('utf-8')
+
+    analysis = {
+        'repository_root': str(repo),
+        'files': [str(src)],
+        'decision_artifacts': {
+            'artifacts': [
+                {
+                    'id': 'f1',
+                    'type': 'finding',
+                    'severity': 'HIGH',
+                    'title': 'Multiple citations',
+                    'description': 'Several snippets from one file',
+                    'evidence': [
+                        {'source_path': 'file.py', 'snippet': 'first match'},
+                        {'source_path': 'file.py', 'snippet': 'second\nmatch'},
+                    ]
+                }
+            ]
+        }
+    }
+
+    output = generate_machine_output(analysis, str(repo))
+    first, second = output['decision_artifacts']['artifacts'][0]['evidence']
+    assert first['line_range'] == [2, 2]
+    assert first['byte_range'] == [raw.find(b'first match'), raw.find(b'first match') + 11]
+    assert second['line_range'] == [3, 4]
+    assert second['byte_range'] == [raw.find(b'second'), raw.find(b'second') + 12]
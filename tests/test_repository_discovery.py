@@ -1,7 +1,6 @@
 """Tests for repository discovery functionality."""
 
 import subprocess
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -16,9 +15,7 @@ def test_discover_repository_root_git(tmp_path):
     repo_dir.mkdir()
     
     # Initialize git
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True, capture_output=True)
     
     # Create files
     (repo_dir / "file1.txt").write_text("content1")
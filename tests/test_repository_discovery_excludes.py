@@ -1,6 +1,3 @@
-import tempfile
-from pathlib import Path
-
 from src.core.pipeline.repository_discovery import get_canonical_file_list
 
 
@@ -31,3 +28,31 @@ def test_excludes_skip_generated_dirs_and_files(tmp_path):
     assert not any('lib.so' in p for p in files)
     # Files that should be present
     assert any('src/main.py' in p for p in files)
+
+
+def test_git_repo_listing_skips_ignored_files(tmp_path):
+    import subprocess
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True, capture_output=True)
+
+    (repo / ".gitignore").write_text("ignored/\n*.log\n")
+    (repo / "src").mkdir()
+    (repo / "src" / "main.py").write_text("print('x')")
+    (repo / "ignored").mkdir()
+    (repo / "ignored" / "big.txt").write_text("data")
+    (repo / "debug.log").write_text("log")
+    (repo / "dist").mkdir()
+    (repo / "dist" / "out.txt").write_text("built")
+
+    files = get_canonical_file_list(str(repo))
+    assert any(p.endswith('src/main.py') for p in files)
+    assert any(p.endswith('.gitignore') for p in files)
+    assert not any('/ignored/' in p for p in files)
+    assert not any(p.endswith('debug.log') for p in files)
+    # Walker exclusions still apply to untracked, non-ignored paths
+    assert not any('/dist/' in p for p in files)
+    # The git directory itself is still inventoried
+    assert any('/.git/' in p for p in files)
+    assert files == sorted(files)
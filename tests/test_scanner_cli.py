@@ -1,21 +1,22 @@
 """Test suite for repository scanner CLI and components."""
 
-import json
+import contextlib
+import io
 import os
-import shutil
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
 import pytest
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-@pytest.fixture
-def test_repo(tmp_path):
-    """Create a test repository with known structure."""
-    # Create a temporary directory structure
-    repo_dir = tmp_path / "test_repo"
+
+def _write_test_repo(repo_dir):
+    """Populate ``repo_dir`` with the known test repository structure."""
     repo_dir.mkdir()
     
     # Create some files
@@ -26,7 +27,13 @@ def test_repo(tmp_path):
     (repo_dir / "tests").mkdir()
     (repo_dir / "tests" / "test_main.py").write_text("def test_hello():\n    assert True")
     (repo_dir / ".gitignore").write_text("*.pyc\n__pycache__/")
-    
+
+
+@pytest.fixture
+def test_repo(tmp_path):
+    """Create a test repository with known structure."""
+    repo_dir = tmp_path / "test_repo"
+    _write_test_repo(repo_dir)
     return repo_dir
 
 
@@ -39,20 +46,58 @@ def output_dir(tmp_path):
 
 
 def run_scanner(repo_path, output_dir, format="both", report_type=None):
-    """Run the scanner CLI and return the result."""
-    cmd = [sys.executable, "-m", "src.cli", "scan", str(repo_path), "--output-dir", str(output_dir)]
+    """Run the scanner CLI in-process and return a CompletedProcess-like result."""
+    from src.cli import main as cli_main
+
+    argv = ["scan", str(repo_path), "--output-dir", str(output_dir)]
     if format != "both":
-        cmd.extend(["--format", format])
+        argv.extend(["--format", format])
     if report_type:
-        cmd.extend(["--report-type", report_type])
-    
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path(__file__).parent.parent)
-    return result
+        argv.extend(["--report-type", report_type])
 
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    cwd = os.getcwd()
+    # Relative lookups (schemas, analysis cache) resolve from the project root
+    os.chdir(Path(__file__).parent.parent)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                cli_main(argv)
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else 1
+    finally:
+        os.chdir(cwd)
+    return subprocess.CompletedProcess(argv, returncode, stdout.getvalue(), stderr.getvalue())
 
-def test_cli_valid_repository(test_repo, output_dir):
+
+def run_scanner_subprocess(repo_path, output_dir):
+    """Run the scanner CLI in a fresh interpreter and return the result.
+
+    Nothing is shared with earlier runs: no module caches and a new hash seed.
+    """
+    cmd = [sys.executable, "-m", "src.cli", "scan", str(repo_path), "--output-dir", str(output_dir)]
+    return subprocess.run(cmd, capture_output=True, text=True, cwd=Path(__file__).parent.parent)
+
+
+@pytest.fixture(scope="session")
+def scanned_outputs(tmp_path_factory):
+    """Scan the test repository once with default options.
+
+    Returns ``(result, output_dir)``; tests sharing it must only read the outputs.
+    """
+    base = tmp_path_factory.mktemp("scanned_outputs")
+    repo_dir = base / "test_repo"
+    _write_test_repo(repo_dir)
+    out_dir = base / "output"
+    out_dir.mkdir()
+    result = run_scanner(repo_dir, out_dir)
+    return result, out_dir
+
+
+def test_cli_valid_repository(scanned_outputs):
     """Test CLI with a valid repository."""
-    result = run_scanner(test_repo, output_dir)
+    result, output_dir = scanned_outputs
     
     assert result.returncode == 0
     assert "Scan completed successfully" in result.stdout
@@ -71,19 +116,14 @@ def test_cli_invalid_repository(output_dir):
     assert "does not exist" in result.stderr
 
 
-def test_cli_file_as_repo(output_dir):
+def test_cli_file_as_repo(tmp_path, output_dir):
     """Test CLI with a file instead of directory."""
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(b"not a directory")
-        file_path = f.name
+    file_path = tmp_path / "notadir.bin"
+    file_path.write_bytes(b"not a directory")
     
-    try:
-        result = run_scanner(file_path, output_dir)
-        assert result.returncode == 1
-        assert "not a directory" in result.stderr
-    finally:
-        os.unlink(file_path)
+    result = run_scanner(file_path, output_dir)
+    assert result.returncode == 1
+    assert "not a directory" in result.stderr
 
 
 def test_cli_markdown_only(test_repo, output_dir):
@@ -104,9 +144,9 @@ def test_cli_json_only(test_repo, output_dir):
     assert (output_dir / "scan_report.json").exists()
 
 
-def test_output_markdown_structure(test_repo, output_dir):
+def test_output_markdown_structure(scanned_outputs):
     """Test that markdown output has required sections."""
-    run_scanner(test_repo, output_dir)
+    _, output_dir = scanned_outputs
     
     content = (output_dir / "scan_report.md").read_text()
     
@@ -127,12 +167,11 @@ def test_output_markdown_structure(test_repo, output_dir):
         assert section in content
 
 
-def test_output_json_schema(test_repo, output_dir):
+def test_output_json_schema(scanned_outputs):
     """Test that JSON output matches expected schema."""
-    run_scanner(test_repo, output_dir)
+    _, output_dir = scanned_outputs
     
-    with open(output_dir / "scan_report.json") as f:
-        data = json.load(f)
+    data = loads((output_dir / "scan_report.json").read_bytes())
     
     # Check required top-level keys
     required_keys = ["run_id", "repository", "summary", "tasks", "gaps", "metadata"]
@@ -164,23 +203,25 @@ def test_determinism(test_repo, tmp_path):
     output1.mkdir()
     output2.mkdir()
     
-    # Run scanner twice
-    run_scanner(test_repo, output1)
-    run_scanner(test_repo, output2)
+    # Run scanner twice, each in its own process, so neither run can reuse
+    # the other's module caches and process-dependent ordering is exercised
+    assert run_scanner_subprocess(test_repo, output1).returncode == 0
+    assert run_scanner_subprocess(test_repo, output2).returncode == 0
     
     # Compare markdown outputs
-    md1 = (output1 / "scan_report.md").read_text()
-    md2 = (output2 / "scan_report.md").read_text()
-    assert md1 == md2
-    
-    # Compare JSON outputs
-    with open(output1 / "scan_report.json") as f1, open(output2 / "scan_report.json") as f2:
-        json1 = json.load(f1)
-        json2 = json.load(f2)
-    
-    # Remove non-deterministic fields for comparison (if any)
+    md1 = (output1 / "scan_report.md").read_bytes()
+    md2 = (output2 / "scan_report.md").read_bytes()
+    if md1 != md2:
+        # Decode only on mismatch, for a readable diff
+        assert md1.decode() == md2.decode()
+    
+    # Compare JSON outputs byte for byte; parse only on mismatch so the
+    # failure shows a structural diff.
     # For now, assume all fields should be identical
-    assert json1 == json2
+    json1 = (output1 / "scan_report.json").read_bytes()
+    json2 = (output2 / "scan_report.json").read_bytes()
+    if json1 != json2:
+        assert loads(json1) == loads(json2)
 
 
 def test_repository_discovery_git_repo(test_repo, output_dir):
@@ -194,8 +235,7 @@ def test_repository_discovery_git_repo(test_repo, output_dir):
     
     run_scanner(test_repo, output_dir)
     
-    with open(output_dir / "scan_report.json") as f:
-        data = json.load(f)
+    data = loads((output_dir / "scan_report.json").read_bytes())
     
     # Should detect the git root
     assert data["repository"]["path"] == str(test_repo)
@@ -212,8 +252,7 @@ def test_repository_discovery_non_git(tmp_path, output_dir):
     
     run_scanner(repo_dir, output_dir)
     
-    with open(output_dir / "scan_report.json") as f:
-        data = json.load(f)
+    data = loads((output_dir / "scan_report.json").read_bytes())
     
     # Should use the provided directory as root
     assert data["repository"]["path"] == str(repo_dir)
@@ -274,9 +313,9 @@ def test_cli_report_type_both(test_repo, output_dir):
     assert (output_dir / "verdict_report.md").exists()
 
 
-def test_cli_report_type_default(test_repo, output_dir):
+def test_cli_report_type_default(scanned_outputs):
     """Test CLI default behavior (should be comprehensive)."""
-    result = run_scanner(test_repo, output_dir)
+    result, output_dir = scanned_outputs
     
     assert result.returncode == 0
     assert "Comprehensive report written" in result.stdout
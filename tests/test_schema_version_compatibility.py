@@ -1,7 +1,11 @@
-import json
 import pytest
 from pathlib import Path
-from src.core.quality.output_contract import generate_machine_output
+from src.core.quality.output_contract import generate_machine_output, serialize_machine_output
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 
 def test_scan_report_includes_schema_version_if_defined(tmp_path):
@@ -14,11 +18,13 @@ def test_scan_report_includes_schema_version_if_defined(tmp_path):
         pytest.skip("No scan_report schema present")
 
     try:
-        schema = json.loads(schema_path.read_text())
+        schema = loads(schema_path.read_bytes())
     except Exception:
         pytest.skip("Unable to read scan_report schema")
 
-    governance_props = schema.get("properties", {}).get("governance", {}).get("properties", {})
+    props = schema.get("properties") or {}
+    governance = props.get("governance") or {}
+    governance_props = governance.get("properties") or {}
     if "schema_version" not in governance_props:
         pytest.skip("Schema does not declare governance.schema_version; skipping compatibility assertion")
 
@@ -29,8 +35,9 @@ def test_scan_report_includes_schema_version_if_defined(tmp_path):
         "decision_artifacts": {}
     }
     out = generate_machine_output(analysis, str(tmp_path))
-    gov = out.get("governance", {})
-    assert "schema_version" in gov and gov.get("schema_version"), (
+    gov = out.get("governance") or {}
+    schema_version = gov.get("schema_version")
+    assert schema_version, (
         "Schema declares governance.schema_version but generated output is missing governance.schema_version"
     )
 
@@ -38,13 +45,13 @@ def test_scan_report_includes_schema_version_if_defined(tmp_path):
     verpath = Path('docs') / 'schemas' / 'VERSION'
     if verpath.exists():
         expected = verpath.read_text(encoding='utf-8').strip()
-        assert gov.get('schema_version') == expected, (
-            f"Generated governance.schema_version ({gov.get('schema_version')}) does not match docs/schemas/VERSION ({expected})"
+        assert schema_version == expected, (
+            f"Generated governance.schema_version ({schema_version}) does not match docs/schemas/VERSION ({expected})"
         )
 
     # Validate the generated output against the scan_report schema
     # This will raise an exception (fail test) if validation fails.
     from src.core.quality import schema_validator
     tmp_json = tmp_path / 'scan_report.json'
-    tmp_json.write_text(json.dumps(out), encoding='utf-8')
+    tmp_json.write_bytes(serialize_machine_output(out))
     schema_validator.validate_scan_report(str(tmp_json))
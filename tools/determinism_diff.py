@@ -3,33 +3,40 @@
 from pathlib import Path
 import json
 import difflib
+import itertools
+
+from report_io import dumps_canonical, read_json, sha256_file
 
 RUNS_DIR = Path('outputs_determinism')
 OUT_DIR = Path('tmp_scan_output')
 OUT_DIR.mkdir(exist_ok=True)
+# Diff lines included per run in the markdown report
+MAX_DIFF_LINES = 400
 
 
 def canonicalize(obj):
-    # Recursively canonicalize JSON: sort dict keys; sort lists if possible
+    # Canonicalize JSON in place: sort lists of id-keyed dicts by id and lists
+    # of primitives by value. Dict key order is left to the serializer.
     if isinstance(obj, dict):
-        return {k: canonicalize(obj[k]) for k in sorted(obj.keys())}
-    if isinstance(obj, list):
+        for v in obj.values():
+            canonicalize(v)
+    elif isinstance(obj, list):
+        for x in obj:
+            canonicalize(x)
         # if list of dicts with 'id', sort by id
         if all(isinstance(x, dict) and 'id' in x for x in obj):
-            return sorted((canonicalize(x) for x in obj), key=lambda d: d.get('id'))
+            obj.sort(key=lambda d: d.get('id'))
         # if list of primitives, sort
-        if all(not isinstance(x, (dict, list)) for x in obj):
+        elif all(not isinstance(x, (dict, list)) for x in obj):
             try:
-                return sorted(obj)
+                obj.sort()
             except Exception:
-                return [canonicalize(x) for x in obj]
-        return [canonicalize(x) for x in obj]
+                pass
     return obj
 
 
 def load_and_canon(path: Path):
-    data = json.loads(path.read_text(encoding='utf-8'))
-    return canonicalize(data)
+    return canonicalize(read_json(path))
 
 
 def main():
@@ -38,42 +45,53 @@ def main():
         print('No run directories found under outputs_determinism/')
         return
 
-    canon_texts = {}
-    raw_texts = {}
+    # Hash raw reports first; runs byte-identical to the baseline cannot
+    # differ after canonicalization, so only mismatches are parsed
+    shas = {}
     for r in runs:
         rpt = r / 'scan_report.json'
         if not rpt.exists():
             print('Missing', rpt)
             continue
-        canon = load_and_canon(rpt)
-        txt = json.dumps(canon, indent=2, ensure_ascii=False, sort_keys=True)
-        canon_texts[r.name] = txt.splitlines()
-        raw_texts[r.name] = rpt.read_text(encoding='utf-8').splitlines()
+        shas[r.name] = sha256_file(rpt)
 
     # Choose first run as baseline
     baseline = runs[0].name
+    canon_texts = {}
+
+    def _canon_lines(name):
+        if name not in canon_texts:
+            txt = dumps_canonical(load_and_canon(RUNS_DIR / name / 'scan_report.json'), indent=True).decode('utf-8')
+            canon_texts[name] = txt.splitlines()
+        return canon_texts[name]
+
     diffs = {}
-    for name, lines in canon_texts.items():
+    for name, sha in shas.items():
         if name == baseline:
             continue
-        d = list(difflib.unified_diff(canon_texts[baseline], lines, fromfile=baseline, tofile=name, lineterm=''))
-        diffs[name] = d
+        if sha == shas.get(baseline):
+            diffs[name] = ([], 0)
+            continue
+        # Keep only the lines the markdown report shows; the rest are counted
+        d = difflib.unified_diff(_canon_lines(baseline), _canon_lines(name), fromfile=baseline, tofile=name, lineterm='')
+        head = list(itertools.islice(d, MAX_DIFF_LINES))
+        diffs[name] = (head, len(head) + sum(1 for _ in d))
 
     # Write report
     report = {
         'baseline': baseline,
-        'runs': list(canon_texts.keys()),
-        'diffs': {k: len(v) for k, v in diffs.items()}
+        'runs': list(shas.keys()),
+        'diffs': {k: total for k, (_, total) in diffs.items()}
     }
     (OUT_DIR / 'determinism_canonical_report.json').write_text(json.dumps(report, indent=2), encoding='utf-8')
 
     md = ['# Determinism Canonical Diff Report', '', f'- Baseline: {baseline}', '']
-    for name, d in diffs.items():
-        md.append(f'## Diff: {baseline} -> {name} (lines changed: {len(d)})')
-        if d:
+    for name, (head, total) in diffs.items():
+        md.append(f'## Diff: {baseline} -> {name} (lines changed: {total})')
+        if head:
             md.append('```diff')
-            md.extend(d[:400])
-            if len(d) > 400:
+            md.extend(head)
+            if total > MAX_DIFF_LINES:
                 md.append('... (truncated)')
             md.append('```')
         md.append('')
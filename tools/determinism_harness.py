@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 """Determinism harness: run the scanner multiple times and compare machine outputs."""
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import subprocess
-import hashlib
 import json
+import shutil
+import tempfile
+
+from report_io import sha256_file
 
 ROOT = Path('.')
 OUT_BASE = Path('outputs_determinism')
@@ -13,28 +17,44 @@ RUNS = 3
 run_shas = []
 details = {}
 
-for i in range(1, RUNS + 1):
+
+def _prepare_outdir(i):
     outdir = OUT_BASE / f'run_{i}'
     if outdir.exists():
         # clear previous
-        for p in outdir.glob('*'):
-            if p.is_file():
-                p.unlink()
-    else:
-        outdir.mkdir(parents=True)
+        shutil.rmtree(outdir)
+    outdir.mkdir(parents=True)
+    return outdir
+
+
+def _run_one(i):
+    # Runs execute concurrently, so each writes to a staging directory outside
+    # the scanned tree; otherwise one run could observe another's partial output
+    staging = Path(tempfile.mkdtemp(prefix=f'determinism_run_{i}_'))
+    print(f'Run {i}: generating output in {staging}')
+    subprocess.run(['python', '-m', 'src.cli', 'scan', '.', '--output-dir', str(staging), '--format', 'json'], check=True)
+    return staging
+
+
+# Clear every run directory first so all runs scan an identical tree
+outdirs = [_prepare_outdir(i) for i in range(1, RUNS + 1)]
+
+# Each run is an independent process; threads only wait on them
+with ThreadPoolExecutor(max_workers=RUNS) as executor:
+    stagings = list(executor.map(_run_one, range(1, RUNS + 1)))
 
-    # run scan
-    print(f'Run {i}: generating output in {outdir}')
-    subprocess.run(['python', '-m', 'src.cli', 'scan', '.', '--output-dir', str(outdir), '--format', 'json'], check=True)
+for i, (outdir, staging) in enumerate(zip(outdirs, stagings), start=1):
+    for p in staging.iterdir():
+        shutil.move(str(p), str(outdir / p.name))
+    staging.rmdir()
 
     rpt = outdir / 'scan_report.json'
     if not rpt.exists():
         raise SystemExit(f'Missing output {rpt}')
 
-    b = rpt.read_bytes()
-    sha = hashlib.sha256(b).hexdigest()
+    sha = sha256_file(rpt)
     run_shas.append(sha)
-    details[f'run_{i}'] = {'sha': sha, 'size': len(b)}
+    details[f'run_{i}'] = {'sha': sha, 'size': rpt.stat().st_size}
 
 unique = sorted(set(run_shas))
 consistent = len(unique) == 1
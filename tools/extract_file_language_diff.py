@@ -3,46 +3,121 @@
 from pathlib import Path
 import json
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+from report_io import STREAM_THRESHOLD, map_runs, write_json
+
 RUNS_DIR = Path('outputs_determinism')
 OUT_DIR = Path('tmp_scan_output')
 OUT_DIR.mkdir(exist_ok=True)
 
+
+_MISSING = object()
+
+
+def _stream_lang_map(rpt_path):
+    """Collect {file: language} from a report without building the JSON tree.
+
+    Matches ``load_lang_map``: dicts carrying both keys are applied in
+    document (pre-)order, so later dicts win for a repeated file.
+    """
+    found = []
+    stack = []  # one entry per open container: [order, key, file, language] or None for arrays
+    order = 0
+    with open(rpt_path, 'rb') as f:
+        for _, event, value in ijson.parse(f):
+            if event == 'start_map':
+                stack.append([order, None, _MISSING, _MISSING])
+                order += 1
+            elif event == 'start_array':
+                stack.append(None)
+            elif event == 'map_key':
+                stack[-1][1] = value
+            elif event == 'end_map':
+                frame = stack.pop()
+                if frame[2] is not _MISSING and frame[3] is not _MISSING:
+                    found.append((frame[0], frame[2], frame[3]))
+            elif event == 'end_array':
+                stack.pop()
+            elif stack and stack[-1] is not None:
+                # scalar value inside a map
+                frame = stack[-1]
+                if frame[1] == 'file':
+                    frame[2] = value
+                elif frame[1] == 'language':
+                    frame[3] = value
+    found.sort(key=lambda item: item[0])
+    return {file: language for _, file, language in found}
+
+
+class _Found(list):
+    """(file, language) pairs harvested from a decoded subtree, in document order."""
+
+
+def _gather(value, found):
+    """Append the pairs held by a decoded value (a hooked dict or a list of them)."""
+    if isinstance(value, _Found):
+        found.extend(value)
+    elif isinstance(value, list):
+        for item in value:
+            _gather(item, found)
+
+
+def _lang_hook(obj):
+    # Called by the C decoder as each dict is built (innermost first). The dict
+    # is replaced by the pairs found in it, own pair first, so the tree is
+    # never kept and the result matches a pre-order walk.
+    found = _Found()
+    if 'file' in obj and 'language' in obj:
+        found.append((obj['file'], obj.get('language')))
+    for v in obj.values():
+        _gather(v, found)
+    return found or None
+
+
 def load_lang_map(rpt_path):
-    data = json.loads(rpt_path.read_text(encoding='utf-8'))
-    # try common locations where per-file language is recorded
-    maps = {}
-    # search recursively for dicts with 'file' and 'language'
-    def walk(obj):
-        if isinstance(obj, dict):
-            if 'file' in obj and 'language' in obj:
-                maps[obj['file']] = obj.get('language')
-            for v in obj.values():
-                walk(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                walk(item)
-    walk(data)
-    return maps
-
-results = {}
-for run in sorted(p for p in RUNS_DIR.glob('run_*') if p.is_dir()):
-    rpt = run / 'scan_report.json'
+    if HAS_IJSON and rpt_path.stat().st_size > STREAM_THRESHOLD:
+        return _stream_lang_map(rpt_path)
+    # search every dict with 'file' and 'language' while decoding; later dicts win
+    found = _Found()
+    _gather(json.loads(rpt_path.read_bytes(), object_hook=_lang_hook), found)
+    return dict(found)
+
+
+def process_run(run_dir: Path):
+    """Return the {file: language} map of one run, or None if it has no report."""
+    rpt = run_dir / 'scan_report.json'
     if not rpt.exists():
-        continue
-    results[run.name] = load_lang_map(rpt)
-
-# compute differing files
-all_files = set()
-for m in results.values():
-    all_files.update(m.keys())
-
-diffs = {}
-for f in sorted(all_files):
-    vals = {r: results[r].get(f) for r in results}
-    uniq = set(v for v in vals.values())
-    if len(uniq) > 1:
-        diffs[f] = vals
-
-json_path = OUT_DIR / 'file_language_diffs.json'
-json_path.write_text(json.dumps({'counts': {r: len(results[r]) for r in results}, 'diffs': diffs}, indent=2), encoding='utf-8')
-print(f'Wrote {json_path} with {len(diffs)} differing files')
+        return None
+    return load_lang_map(rpt)
+
+
+def main():
+    runs = sorted(p for p in RUNS_DIR.glob('run_*') if p.is_dir())
+    # Reports are independent; large sets are parsed in a process pool
+    maps = map_runs(process_run, runs)
+    results = {run.name: m for run, m in zip(runs, maps) if m is not None}
+
+    # compute differing files
+    all_files = set()
+    for m in results.values():
+        all_files.update(m.keys())
+
+    diffs = {}
+    for f in sorted(all_files):
+        vals = {r: results[r].get(f) for r in results}
+        uniq = set(v for v in vals.values())
+        if len(uniq) > 1:
+            diffs[f] = vals
+
+    json_path = OUT_DIR / 'file_language_diffs.json'
+    write_json(json_path, {'counts': {r: len(results[r]) for r in results}, 'diffs': diffs})
+    print(f'Wrote {json_path} with {len(diffs)} differing files')
+
+
+if __name__ == '__main__':
+    main()
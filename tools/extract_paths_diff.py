@@ -1,13 +1,36 @@
 #!/usr/bin/env python3
 """Extract filesystem paths from scan_report.json across runs and diff them."""
 from pathlib import Path
-import json
 import re
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+from report_io import STREAM_THRESHOLD, map_runs, read_json, write_json
+
 RUNS_DIR = Path('outputs_determinism')
 OUT_DIR = Path('tmp_scan_output')
 OUT_DIR.mkdir(exist_ok=True)
 
+# Compiled once: string leaves are tested against these for every report
+_CWD_RE = re.compile(r'\b' + re.escape(str(Path.cwd())))
+_SPLIT_RE = re.compile(r"[,;]\s*")
+
+
+def _string_paths(obj, prefix):
+    """Return the ``prefix`` paths mentioned in a string leaf."""
+    paths = set()
+    if obj.startswith(prefix) or _CWD_RE.search(obj):
+        # split possible lists inside strings
+        for part in _SPLIT_RE.split(obj):
+            if part.startswith(prefix):
+                paths.add(part)
+    return paths
+
+
 def collect_paths(obj, prefix='/home'):
     paths = set()
     if isinstance(obj, dict):
@@ -17,49 +40,69 @@ def collect_paths(obj, prefix='/home'):
         for item in obj:
             paths.update(collect_paths(item, prefix))
     elif isinstance(obj, str):
-        if obj.startswith(prefix) or re.search(r'\b' + re.escape(str(Path.cwd())) , obj):
-            # split possible lists inside strings
-            for part in re.split(r"[,;]\s*", obj):
-                if part.startswith(prefix):
-                    paths.add(part)
+        paths.update(_string_paths(obj, prefix))
+    return paths
+
+
+def _stream_paths(rpt_path, prefix='/home'):
+    """``collect_paths`` over a report file, streaming string values with ijson."""
+    paths = set()
+    with open(rpt_path, 'rb') as f:
+        for _, event, value in ijson.parse(f):
+            if event == 'string':
+                paths.update(_string_paths(value, prefix))
     return paths
 
-results = {}
-for run in sorted(p for p in RUNS_DIR.glob('run_*') if p.is_dir()):
-    rpt = run / 'scan_report.json'
+
+def process_run(run_dir: Path):
+    """Return the set of paths mentioned in one run's report, or None if it has no report."""
+    rpt = run_dir / 'scan_report.json'
     if not rpt.exists():
-        continue
-    data = json.loads(rpt.read_text(encoding='utf-8'))
-    paths = collect_paths(data)
-    results[run.name] = sorted(paths)
-
-# write per-run lists
-for k, v in results.items():
-    (OUT_DIR / f'files_{k}.txt').write_text('\n'.join(v), encoding='utf-8')
-
-# compute diffs between runs
-runs = sorted(results.keys())
-diffs = {}
-for i in range(1, len(runs)):
-    a = set(results[runs[0]])
-    b = set(results[runs[i]])
-    diffs[runs[i]] = {
-        'only_in_baseline': sorted(list(a - b)),
-        'only_in_run': sorted(list(b - a))
-    }
-
-out = {'per_run_counts': {k: len(v) for k, v in results.items()}, 'diffs': diffs}
-json_path = OUT_DIR / 'files_list_diff.json'
-json_path.write_text(json.dumps(out, indent=2), encoding='utf-8')
-md_lines = ['# Files List Diff', '']
-for k, v in out['per_run_counts'].items():
-    md_lines.append(f'- {k}: {v} paths')
-md_lines.append('')
-for run, d in diffs.items():
-    md_lines.append(f'## Diff baseline -> {run}')
-    md_lines.append(f'- Only in baseline: {len(d["only_in_baseline"])}')
-    md_lines.append(f'- Only in run: {len(d["only_in_run"])}')
+        return None
+    if HAS_IJSON and rpt.stat().st_size > STREAM_THRESHOLD:
+        return _stream_paths(rpt)
+    return collect_paths(read_json(rpt))
+
+
+def main():
+    run_dirs = sorted(p for p in RUNS_DIR.glob('run_*') if p.is_dir())
+    # Reports are independent; large sets are parsed in a process pool
+    path_sets = map_runs(process_run, run_dirs)
+    # Keep each run's paths as a set; sort only when writing
+    results = {run.name: frozenset(paths) for run, paths in zip(run_dirs, path_sets) if paths is not None}
+
+    # write per-run lists
+    for k, v in results.items():
+        (OUT_DIR / f'files_{k}.txt').write_text('\n'.join(sorted(v)), encoding='utf-8')
+
+    # compute diffs between runs
+    runs = sorted(results.keys())
+    diffs = {}
+    if runs:
+        base = results[runs[0]]
+        for run in runs[1:]:
+            other = results[run]
+            diffs[run] = {
+                'only_in_baseline': sorted(base - other),
+                'only_in_run': sorted(other - base)
+            }
+
+    out = {'per_run_counts': {k: len(v) for k, v in results.items()}, 'diffs': diffs}
+    json_path = OUT_DIR / 'files_list_diff.json'
+    write_json(json_path, out)
+    md_lines = ['# Files List Diff', '']
+    for k, v in out['per_run_counts'].items():
+        md_lines.append(f'- {k}: {v} paths')
     md_lines.append('')
+    for run, d in diffs.items():
+        md_lines.append(f'## Diff baseline -> {run}')
+        md_lines.append(f'- Only in baseline: {len(d["only_in_baseline"])}')
+        md_lines.append(f'- Only in run: {len(d["only_in_run"])}')
+        md_lines.append('')
+
+    (OUT_DIR / 'files_list_diff.md').write_text('\n'.join(md_lines), encoding='utf-8')
+    print('Wrote files_list_diff.json and .md in tmp_scan_output')
+
 
-(OUT_DIR / 'files_list_diff.md').write_text('\n'.join(md_lines), encoding='utf-8')
-print('Wrote files_list_diff.json and .md in tmp_scan_output')
+if __name__ == '__main__':
+    main()
@@ -1,44 +1,82 @@
 #!/usr/bin/env python3
 """Find differing JSON leaf values across deterministic run outputs."""
 from pathlib import Path
-import json
+
+from report_io import dumps_canonical, map_runs, read_json, write_json
 
 RUNS_DIR = Path('outputs_determinism')
 
 def load_json(run_dir: Path):
-    rpt = run_dir / 'scan_report.json'
-    return json.loads(rpt.read_text(encoding='utf-8'))
+    return read_json(run_dir / 'scan_report.json')
+
 
 def gather_paths(obj, prefix=''):
+    # Iterative walk with an explicit stack: no recursion limit on deep
+    # reports and no intermediate dict per subtree. Children are pushed in
+    # reverse so leaves are still emitted in document order.
     paths = {}
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            sub = gather_paths(v, prefix + '/' + k if prefix else k)
-            paths.update(sub)
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj):
-            sub = gather_paths(item, f"{prefix}[{i}]")
-            paths.update(sub)
-    else:
-        paths[prefix] = obj
+    stack = [(obj, prefix)]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(reversed([(v, path + '/' + k if path else k) for k, v in node.items()]))
+        elif isinstance(node, list):
+            stack.extend(reversed([(item, f"{path}[{i}]") for i, item in enumerate(node)]))
+        else:
+            paths[path] = node
     return paths
 
-runs = sorted([p for p in RUNS_DIR.glob('run_*') if p.is_dir()])
-data = {r.name: load_json(r) for r in runs}
-
-all_paths = {}
-for name, obj in data.items():
-    pmap = gather_paths(obj)
-    for p, v in pmap.items():
-        all_paths.setdefault(p, {})[name] = v
-
-diffs = {}
-for p, m in all_paths.items():
-    # if not all equal
-    vals = list(m.values())
-    if len(set(map(lambda x: json.dumps(x, sort_keys=True), vals))) > 1:
-        diffs[p] = m
-
-out_path = Path('tmp_scan_output/json_leaf_diffs.json')
-out_path.write_text(json.dumps({'diff_count': len(diffs), 'diffs': diffs}, indent=2), encoding='utf-8')
-print(f'Found {len(diffs)} differing leaf paths; wrote tmp_scan_output/json_leaf_diffs.json')
+
+# Leaf types whose equality, once the type is fixed, is exactly JSON equality.
+# Floats are left out: -0.0 == 0.0 in Python but they encode differently.
+_EXACT_TYPES = frozenset((int, bool, type(None)))
+
+
+def _compare_key(value):
+    """Key that is equal for two leaves exactly when their canonical JSON is.
+
+    Strings and exact scalars are used as they are, tagged with their type so
+    that 1, 1.0 and True stay distinct; anything else is serialized.
+    """
+    t = type(value)
+    if t is str:
+        return value
+    if t in _EXACT_TYPES:
+        return (t, value)
+    return dumps_canonical(value)
+
+
+def process_run(run_dir: Path):
+    """Load one run's report and return its flattened {leaf path: (value, compare key)} map.
+
+    Each leaf's key is built once here so comparing runs is an equality check.
+    """
+    return {p: (v, _compare_key(v)) for p, v in gather_paths(load_json(run_dir)).items()}
+
+
+def main():
+    runs = sorted([p for p in RUNS_DIR.glob('run_*') if p.is_dir()])
+    # Reports are independent; large sets are parsed in a process pool
+    flattened = map_runs(process_run, runs)
+
+    # Compare every run against the first key seen for each path; only
+    # paths where two runs disagree are kept, so equal leaves (the
+    # deterministic case) are never grouped or copied
+    first = {p: key for p, (_, key) in flattened[0].items()} if flattened else {}
+    differing = set()
+    for pmap in flattened[1:]:
+        for p, (_, key) in pmap.items():
+            if first.setdefault(p, key) != key:
+                differing.add(p)
+
+    diffs = {}
+    for p in differing:
+        diffs[p] = {run.name: pmap[p][0] for run, pmap in zip(runs, flattened) if p in pmap}
+
+    out_path = Path('tmp_scan_output/json_leaf_diffs.json')
+    write_json(out_path, {'diff_count': len(diffs), 'diffs': diffs})
+    print(f'Found {len(diffs)} differing leaf paths; wrote tmp_scan_output/json_leaf_diffs.json')
+
+
+if __name__ == '__main__':
+    main()
@@ -4,12 +4,20 @@
 Writes `tmp_scan_output/calibration_report.json` and `tmp_scan_output/calibration_report.md`.
 """
 from pathlib import Path
-import json
+
+from report_io import read_json, write_json
 
 BASE = Path('tests/golden')
 OUT_DIR = Path('tmp_scan_output')
 OUT_DIR.mkdir(exist_ok=True)
 
+
+def high_ids(rep):
+    """IDs of the HIGH severity artifacts in a golden report."""
+    arts = rep.get('decision_artifacts', {}).get('artifacts', [])
+    return {a.get('id') for a in arts if (a.get('severity') or '').upper() == 'HIGH'}
+
+
 expected_files = sorted(BASE.glob('expected_*.json'))
 
 report = {
@@ -26,15 +34,8 @@ for ef in expected_files:
     pf = BASE / f'predicted_{name}.json'
     if not pf.exists():
         continue
-    exp = json.loads(ef.read_text(encoding='utf-8'))
-    pred = json.loads(pf.read_text(encoding='utf-8'))
-
-    def high_ids(rep):
-        arts = rep.get('decision_artifacts', {}).get('artifacts', [])
-        return {a.get('id') for a in arts if (a.get('severity') or '').upper() == 'HIGH'}
-
-    exp_h = high_ids(exp)
-    pred_h = high_ids(pred)
+    exp_h = high_ids(read_json(ef))
+    pred_h = high_ids(read_json(pf))
 
     tp = len(exp_h & pred_h)
     fp = len(pred_h - exp_h)
@@ -68,7 +69,7 @@ report['summary'] = {
 
 # write JSON
 json_path = OUT_DIR / 'calibration_report.json'
-json_path.write_text(json.dumps(report, indent=2), encoding='utf-8')
+write_json(json_path, report)
 
 # write simple markdown
 md_lines = [
@@ -88,12 +89,14 @@ md_lines.append(f"- F1: {f1 if f1 is not None else 'N/A'}")
 md_lines.append('')
 md_lines.append('## Per-repo details')
 md_lines.append('')
-for name, data in report['repos'].items():
-    md_lines.append(f"### {name}")
-    md_lines.append(f"- TP: {data['tp']}  FP: {data['fp']}  FN: {data['fn']}")
-    md_lines.append(f"- Expected HIGH: {', '.join(data['expected_high'])}")
-    md_lines.append(f"- Predicted HIGH: {', '.join(data['predicted_high'])}")
-    md_lines.append('')
+# one entry per repo (its lines plus the blank separator) keeps the list short
+md_lines.extend(
+    f"### {name}\n"
+    f"- TP: {data['tp']}  FP: {data['fp']}  FN: {data['fn']}\n"
+    f"- Expected HIGH: {', '.join(data['expected_high'])}\n"
+    f"- Predicted HIGH: {', '.join(data['predicted_high'])}\n"
+    for name, data in report['repos'].items()
+)
 
 md_path = OUT_DIR / 'calibration_report.md'
 md_path.write_text('\n'.join(md_lines), encoding='utf-8')
@@ -4,22 +4,73 @@
 Produces `tmp_scan_output/verification_summary.json` and `.md` including
 calibration report + adversarial test outputs.
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import json
+import hashlib
+import importlib.metadata
 import subprocess
+import sys
+
+from report_io import read_json, write_json
 
 OUT = Path('tmp_scan_output')
 OUT.mkdir(exist_ok=True)
+# Results of earlier pytest runs, keyed on the code they ran against
+PYTEST_CACHE_DIR = OUT / '.pytest_cache_summary'
+# Inputs whose contents decide a test outcome (schemas are read by the
+# output contract and the schema validator)
+CACHE_KEY_ROOTS = ('src', 'tests', 'docs/schemas')
+CACHE_KEY_FILES = ('pytest.ini', 'pyproject.toml')
+
+
+def _tree_digest() -> str:
+    """Digest of everything a stored test result depends on.
+
+    Covers the interpreter and installed package versions, the source tree,
+    tests, schemas and pytest configuration.
+    """
+    files = [Path(f) for f in CACHE_KEY_FILES if Path(f).is_file()]
+    for root in CACHE_KEY_ROOTS:
+        files.extend(p for p in Path(root).rglob('*') if p.is_file() and '__pycache__' not in p.parts)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(sys.version.encode('utf-8') + b'\0')
+    # An upgraded dependency (jsonschema, orjson, pytest, ...) can change a result
+    installed = sorted(
+        f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions()
+    )
+    h.update('\n'.join(installed).encode('utf-8') + b'\0')
+    for p in sorted(files):
+        h.update(p.as_posix().encode('utf-8') + b'\0')
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def run_pytest(path, tree_digest=None):
+    """Run pytest on ``path``, reusing a stored passing result if nothing changed since.
 
-def run_pytest(path):
-    cmd = ['pytest', '-q', str(path)]
+    Only passing runs are stored, so a failure is always re-run and re-reported.
+    """
+    cmd = ['pytest', '-q', '-p', 'no:cacheprovider', str(path)]
+    cache_file = None
+    if tree_digest is not None:
+        key = hashlib.blake2b(f'{tree_digest}\0{" ".join(cmd)}'.encode('utf-8'), digest_size=8).hexdigest()
+        cache_file = PYTEST_CACHE_DIR / f'{Path(path).stem}_{key}.json'
+        if cache_file.exists():
+            try:
+                return read_json(cache_file)
+            except ValueError:
+                pass  # unreadable entry; run again and overwrite it
     r = subprocess.run(cmd, capture_output=True, text=True)
-    return {
+    result = {
         'path': str(path),
         'returncode': r.returncode,
         'stdout': r.stdout,
         'stderr': r.stderr
     }
+    if cache_file is not None and r.returncode == 0:
+        PYTEST_CACHE_DIR.mkdir(exist_ok=True)
+        write_json(cache_file, result)
+    return result
 
 summary = {}
 
@@ -29,18 +80,20 @@ tests = [
     'tests/test_adversarial_property.py'
 ]
 
+tree_digest = _tree_digest()
+present = [t for t in tests if Path(t).exists()]
+# Each run is a separate pytest process; wait on them together
+with ThreadPoolExecutor(max_workers=max(len(present), 1)) as ex:
+    results = dict(zip(present, ex.map(lambda t: run_pytest(t, tree_digest), present)))
 for t in tests:
-    if Path(t).exists():
-        summary[t] = run_pytest(t)
-    else:
-        summary[t] = {'error': 'test file missing'}
+    summary[t] = results.get(t, {'error': 'test file missing'})
 
 # include calibration report if present
 calib = Path('tmp_scan_output/calibration_report.json')
 calib_data = None
 if calib.exists():
     try:
-        calib_data = json.loads(calib.read_text(encoding='utf-8'))
+        calib_data = read_json(calib)
     except Exception:
         calib_data = None
 
@@ -50,7 +103,7 @@ out = {
 }
 
 json_path = OUT / 'verification_summary.json'
-json_path.write_text(json.dumps(out, indent=2), encoding='utf-8')
+write_json(json_path, out)
 
 md_lines = ['# Verification Summary', '']
 for t, r in summary.items():
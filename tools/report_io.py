@@ -0,0 +1,92 @@
+"""JSON, hashing and run-processing helpers shared by the scripts in tools/.
+
+The tools are run as ``python tools/<name>.py`` from the repository root, so
+this module is importable from them by its bare name.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import hashlib
+import json
+import os
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Reports larger than this are streamed with ijson (when installed) instead of
+# being loaded whole; below it a full orjson parse is faster
+STREAM_THRESHOLD = 2 * 1024 * 1024
+# Combined report size above which runs are parsed in a process pool. A
+# report of a few hundred KB parses in a few ms, less than it costs to start
+# the pool and pickle the results back.
+POOL_THRESHOLD = 8 * 1024 * 1024
+
+
+def read_json(path: Path):
+    """Parse a JSON file from its raw bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+def write_json(path: Path, obj) -> None:
+    """Write ``obj`` as 2-space indented UTF-8 JSON with sorted keys.
+
+    The bytes go to a sibling temp file that is renamed over ``path``, so a
+    reader never sees a partial report.
+    """
+    if HAS_ORJSON:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def dumps_canonical(obj, indent: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON with sorted keys, 2-space indented if ``indent``.
+
+    Equal values give equal bytes. Values orjson rejects (e.g. integers
+    beyond 64 bits) go through the stdlib encoder.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+
+def sha256_file(path: Path) -> str:
+    """Stream a file through SHA-256 without loading it into memory."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _report_size(run_dir: Path) -> int:
+    try:
+        return (run_dir / 'scan_report.json').stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def map_runs(fn, run_dirs):
+    """Return ``[fn(run_dir) for run_dir in run_dirs]``, fanned out when it pays off.
+
+    ``fn`` must be a module-level function. A process pool is used only on a
+    multi-CPU machine and when the runs' reports together exceed
+    ``POOL_THRESHOLD``; otherwise the runs are processed in order here.
+    """
+    cpus = os.cpu_count() or 1
+    if len(run_dirs) > 1 and cpus > 1 and sum(map(_report_size, run_dirs)) > POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=min(len(run_dirs), cpus)) as ex:
+            return list(ex.map(fn, run_dirs))
+    return [fn(r) for r in run_dirs]
@@ -10,13 +10,18 @@ This is a lightweight helper for developers to quickly locate offending
 fields when schema validation fails.
 """
 from pathlib import Path
-import json
 import re
 import sys
 
+from report_io import write_json
+
 OUT = Path('tmp_scan_output')
 OUT.mkdir(exist_ok=True)
 
+# One match per line: the "Missing required key" fallback first, then the
+# jsonschema pointer style "/a/b: 'x' is a required property"
+_DIAG_RE = re.compile(r"Missing required key: (?P<missing>/.+)|(?P<pointer>/[^:]+):\s*(?P<message>.+)")
+
 
 def parse_validator_message(msg: str):
     """Parse typical validator messages into structured diagnostics.
@@ -29,18 +34,14 @@ def parse_validator_message(msg: str):
         line = line.strip()
         if not line:
             continue
-        # Missing required key fallback
-        m = re.match(r"Missing required key: (/.+)", line)
-        if m:
-            diags.append({'pointer': m.group(1), 'message': line})
-            continue
-        # jsonschema pointer style: "/a/b: 'x' is a required property"
-        m = re.match(r"(/[^:]+):\s*(.+)", line)
-        if m:
-            diags.append({'pointer': m.group(1), 'message': m.group(2)})
-            continue
-        # fallback: entire line as message
-        diags.append({'pointer': None, 'message': line})
+        m = _DIAG_RE.match(line)
+        if m is None:
+            # fallback: entire line as message
+            diags.append({'pointer': None, 'message': line})
+        elif m['missing'] is not None:
+            diags.append({'pointer': m['missing'], 'message': line})
+        else:
+            diags.append({'pointer': m['pointer'], 'message': m['message']})
     return diags
 
 
@@ -78,7 +79,7 @@ def main():
 
     todos = triage_from_text(msg)
     outp = OUT / 'schema_triage.json'
-    outp.write_text(json.dumps({'todos': todos}, indent=2), encoding='utf-8')
+    write_json(outp, {'todos': todos})
     print(f'Wrote triage to {outp}')
 
 